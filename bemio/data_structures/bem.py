@@ -13,16 +13,30 @@
 # limitations under the License.
 from __future__ import division
 
+import functools
+
+import multiprocessing
+
 import numpy as np
 
 import os
 
-from scipy import interpolate
+from concurrent.futures import ProcessPoolExecutor
+
+from scipy.fft import dct, dst
+
+from scipy.linalg import expm
+
+from scipy.signal import fftconvolve
 
-from scipy.linalg import hankel, expm
+from scipy.sparse import csr_matrix
+
+from scipy.sparse.linalg import LinearOperator, svds
 
 from progressbar import ProgressBar, Bar, Percentage
 
+from threadpoolctl import threadpool_limits
+
 
 class Raw(object):
     '''bemio.io.bem internal calss to store various data
@@ -256,29 +270,46 @@ class HydrodynamicData(object):
         self.ex.irf.t = np.linspace(-t_end, t_end, n_t)
         self.ex.irf.w = np.linspace(w_min, w_max, n_w)
 
-        self.ex.irf.f = np.zeros([self.ex.mag.shape[0], self.ex.mag.shape[1], self.ex.irf.t.size])
-
-        ex_re_interp = _interpolate_for_irf(self.w, self.ex.irf.w, self.ex.re)
-        ex_im_interp = _interpolate_for_irf(self.w, self.ex.irf.w, self.ex.im)
-
-        pbar_maxval = self.ex.irf.t.size * self.ex.mag.shape[0] * self.ex.mag.shape[1]
-        pbar = ProgressBar(widgets=['Excitation force IRF for ' + self.name + ':', Percentage(), Bar()], maxval=pbar_maxval).start()
-        count = 1
-        for t_ind, t in enumerate(self.ex.irf.t):
-
-          for i in xrange(self.ex.mag.shape[0]):
-
-            for j in xrange(self.ex.mag.shape[1]):
-              tmp = ex_re_interp[i, j, :] * np.cos(self.ex.irf.w * t) - ex_im_interp[i, j, :] * np.sin(self.ex.irf.w * t)
-              tmp *= 1. / np.pi
-              self.ex.irf.f[i, j, t_ind] = np.trapz(y=tmp, x=self.ex.irf.w)
-              pbar.update(count)
-              count += 1
-
-        pbar.finish()
-
-
-    def calc_irf_radiation(self, t_end=100., n_t=1001, n_w=1001, w_min=None, w_max=None):
+        # Pack the real and imaginary coefficients into one contiguous
+        # [2, n_i, n_j, n_w] buffer. The coefficients read from the BEM
+        # output are typically strided views into larger arrays, and the
+        # packed layout lets the interpolation and the contraction stream
+        # both quantities from a single allocation
+        # The interpolated coefficients and the basis tables are held in
+        # single precision: they feed a memory bandwidth bound contraction
+        # whose trapezoid rule truncation error is far larger than single
+        # precision roundoff. The final IRF is stored in double precision
+        ex_ri = np.ascontiguousarray(
+            np.concatenate([self.ex.re[None, :], self.ex.im[None, :]], axis=0))
+        ex_ri_interp = _interpolate_for_irf(
+            self.w, self.ex.irf.w, ex_ri).astype(np.float32)
+        ex_re_interp = ex_ri_interp[0]
+        ex_im_interp = ex_ri_interp[1]
+
+        w = self.ex.irf.w
+        dw = _trapezoid_weights(w)
+
+        # Precompute the cos(w*t) and sin(w*t) bases with the integration
+        # weights folded in and contract the interpolated excitation
+        # coefficients against them. The two tensordot calls are equivalent
+        # to evaluating trapz(ex_re*cos(w*t) - ex_im*sin(w*t), w) for every
+        # (i, j, t) combination
+        wt = np.outer(w, self.ex.irf.t)
+        cos_wt = (np.cos(wt) * (dw / np.pi)[:, None]).astype(np.float32)
+        sin_wt = (np.sin(wt) * (dw / np.pi)[:, None]).astype(np.float32)
+
+        # Stacking the real and imaginary coefficients along the frequency
+        # axis against a [cos, -sin] basis fuses the two contractions and
+        # their difference into a single larger one with no intermediate
+        # arrays
+        ex_interp = np.concatenate([ex_re_interp, ex_im_interp], axis=2)
+        basis = np.concatenate([cos_wt, -sin_wt], axis=0)
+
+        self.ex.irf.f = np.tensordot(
+            ex_interp, basis, axes=([2], [0])).astype(np.float64)
+
+
+    def calc_irf_radiation(self, t_end=100., n_t=1001, n_w=1001, w_min=None, w_max=None, method='trapz'):
         '''Function to calculate the wave radiation impulse response function.
         For more information please see Section 2.4.2 in:
 
@@ -309,6 +340,12 @@ class HydrodynamicData(object):
                 Maximum frequency to use in IRF calculation. If no vlaue is
                 given, this defaults to the maximum      frequency from the BEM
                 simulations
+            method : {'trapz', 'fft'}, optional
+                IRF evaluation method. The default 'trapz' integrates on the
+                t_end/n_t time grid. 'fft' evaluates the integrals as
+                discrete cosine and sine transforms, which is much faster
+                for large grids, but requires w_min = 0 and fixes the
+                timesteps to t_k = k*pi/w_max, ignoring t_end and n_t
 
         Returns:
             No variables are directily returned by thi function. The following
@@ -332,53 +369,10 @@ class HydrodynamicData(object):
             IRF to insure that it is physical. The user may need to adjust the
             t_end, n_t, and n_w values in order to generate a realistic IRF.
         '''
-        if w_min is None:
-            w_min = self.w.min()
-        if w_max is None:
-            w_max = self.w.max()
-
-        self.rd.irf.t = np.linspace(0, t_end, n_t)
-        self.rd.irf.w = np.linspace(w_min, w_max, n_w)
-
-        self.rd.irf.L = np.zeros(
-            [self.am.inf.shape[0], self.am.inf.shape[1], self.rd.irf.t.size])
-        self.rd.irf.K = np.zeros(
-            [self.am.inf.shape[0], self.am.inf.shape[1], self.rd.irf.t.size])
-
-        rd_interp = _interpolate_for_irf(self.w, self.rd.irf.w, self.rd.all)
-
-        # Calculate the IRF
-        pbar_max_val = self.rd.irf.t.size * self.rd.all.shape[0] * self.rd.all.shape[1]
-        pbar = ProgressBar(widgets=['Radiation damping IRF for ' + self.name + ':', Percentage(), Bar()], maxval=pbar_max_val).start()
-        count = 1
-        for t_ind, t in enumerate(self.rd.irf.t):
-
-            for i in xrange(self.rd.all.shape[0]):
-
-                for j in xrange(self.rd.all.shape[1]):
-              # Radiation damping calculation method
-                    tmpL = 2. / np.pi * rd_interp[i, j, :] * np.sin(self.rd.irf.w * t)
-                    tmpK = 2. / np.pi * rd_interp[i, j, :] * np.cos(self.rd.irf.w * t)
-
-                    # Different IRF calculation methods are needed for dimensional and
-                    # nondimensional hydro coefficients
-                    if self.scaled is False:
-
-                        tmpK *= self.rd.irf.w
-
-                    elif self.scaled is True:
-
-                        tmpL /= self.rd.irf.w
-
-                    self.rd.irf.K[i, j, t_ind] = np.trapz(y=tmpK, x=self.rd.irf.w)
-                    self.rd.irf.L[i, j, t_ind] = np.trapz(y=tmpL, x=self.rd.irf.w)
-
-                    pbar.update(count)
-                    count += 1
-
-        pbar.finish()
+        calc_irf_radiation_batch([self], t_end=t_end, n_t=n_t, n_w=n_w,
+                                 w_min=w_min, w_max=w_max, method=method)
 
-    def calc_ss_radiation(self, max_order=10, r2_thresh=0.95):
+    def calc_ss_radiation(self, max_order=10, r2_thresh=0.95, n_processes=None):
         '''Function to calculate the state space reailization of the wave
         radiation IRF.
 
@@ -388,6 +382,10 @@ class HydrodynamicData(object):
             r2_thresh : float
                 The R^2 threshold used for the fit. THe value must be between 0
                 and 1
+            n_processes : int, optional
+                Number of processes used to fit the channels. If no value is
+                given, this defaults to the number of CPUs on the machine. Set
+                to 1 to fit all channels in the calling process
 
         Returns:
             No variables are directily returned by thi function. The following
@@ -412,9 +410,6 @@ class HydrodynamicData(object):
         Examples:
         '''
         dt = self.rd.irf.t[2] - self.rd.irf.t[1]
-        r2bt = np.zeros([self.am.inf.shape[0], self.am.inf.shape[0], self.rd.irf.t.size])
-        k_ss_est = np.zeros(self.rd.irf.t.size)
-        self.rd.ss.irk_bss = np.zeros([self.am.inf.shape[0], self.am.inf.shape[0], self.rd.irf.t.size])
         self.rd.ss.A = np.zeros([6, self.am.inf.shape[1], max_order, max_order])
         self.rd.ss.B = np.zeros([6, self.am.inf.shape[1], max_order, 1])
         self.rd.ss.C = np.zeros([6, self.am.inf.shape[1], 1, max_order])
@@ -424,88 +419,48 @@ class HydrodynamicData(object):
         self.rd.ss.it = np.zeros([6, self.am.inf.shape[1]])
         self.rd.ss.r2t = np.zeros([6, self.am.inf.shape[1]])
 
-        pbar = ProgressBar(widgets=['Radiation damping state space realization for ' + self.name + ':', Percentage(), Bar()], maxval=self.am.inf.shape[0] * self.am.inf.shape[1]).start()
-        count = 0
-        for i in xrange(self.am.inf.shape[0]):
-
-          for j in xrange(self.am.inf.shape[1]):
-
-            r2bt = np.linalg.norm(
-                self.rd.irf.K[i, j, :] - self.rd.irf.K.mean(axis=2)[i, j])
-
-            ss = 2  # Initial state space order
-
-            if r2bt != 0.0:
-              while True:
-
-                # Perform Hankel Singular Value Decomposition
-                y = dt * self.rd.irf.K[i, j, :]
-                h = hankel(y[1::])
-                u, svh, v = np.linalg.svd(h)
-
-                u1 = u[0:self.rd.irf.t.size - 2, 0:ss]
-                v1 = v.T[0:self.rd.irf.t.size - 2, 0:ss]
-                u2 = u[1:self.rd.irf.t.size - 1, 0:ss]
-                sqs = np.sqrt(svh[0:ss].reshape(ss, 1))
-                invss = 1 / sqs
-                ubar = np.dot(u1.T, u2)
-
-                a = ubar * np.dot(invss, sqs.T)
-                b = v1[0, :].reshape(ss, 1) * sqs
-                c = u1[0, :].reshape(1, ss) * sqs.T
-                d = y[0]
+        # 2 norm of each IRF channel about its mean, computed for all
+        # channels in one vectorized reduction
+        k_mean = self.rd.irf.K.mean(axis=2, keepdims=True)
+        r2bt_all = np.linalg.norm(self.rd.irf.K - k_mean, axis=2)
 
-                CoeA = dt / 2
-                CoeB = 1
-                CoeC = -CoeA
-                CoeD = 1
+        # Channels with zero hydrodynamic coefficients are not fit
+        channels = [(i, j) for i in range(self.am.inf.shape[0])
+                    for j in range(self.am.inf.shape[1]) if r2bt_all[i, j] != 0.0]
 
-                # (T/2*I + T/2*A)^{-1}         = 2/T(I + A)^{-1}
-                iidd = np.linalg.inv(CoeA * np.eye(ss) - CoeC * a)
+        if n_processes is None:
+            n_processes = multiprocessing.cpu_count()
 
-                # (A-I)2/T(I + A)^{-1}         = 2/T(A-I)(I + A)^{-1}
-                ac = np.dot(CoeB * a - CoeD * np.eye(ss), iidd)
-                # (T/2+T/2)*2/T(I + A)^{-1}B   = 2(I + A)^{-1}B
-                bc = (CoeA * CoeB - CoeC * CoeD) * np.dot(iidd, b)
-                # C * 2/T(I + A)^{-1}          = 2/T(I + A)^{-1}
-                cc = np.dot(c, iidd)
-                # D - T/2C (2/T(I + A)^{-1})B  = D - C(I + A)^{-1})B
-                dc = d + CoeC * np.dot(np.dot(c, iidd), b)
+        fit = functools.partial(_fit_ss_channel, dt=dt, max_order=max_order,
+                                r2_thresh=r2_thresh)
+        k_channels = [self.rd.irf.K[i, j, :] for i, j in channels]
+        r2bt_channels = [r2bt_all[i, j] for i, j in channels]
 
-                for jj in xrange(self.rd.irf.t.size):
+        if n_processes > 1 and len(channels) > 1:
 
-                  # Calculate impulse response function from state space
-                  # approximation
-                  k_ss_est[jj] = np.dot(np.dot(cc, expm(ac * dt * jj)), bc)
+            # The channels are fit independently, so they are spread over a
+            # process pool. Each worker is limited to a single BLAS thread
+            # so the pool does not oversubscribe the machine
+            with ProcessPoolExecutor(max_workers=n_processes,
+                                     initializer=_limit_blas_threads) as executor:
+                results = list(executor.map(fit, k_channels, r2bt_channels))
 
-                # Calculate 2 norm of the difference between know and estimated
-                # values impulse response function
-                R2TT = np.linalg.norm(self.rd.irf.K[i, j, :] - k_ss_est)
-                # Calculate the R2 value for impulse response function
-                R2T = 1 - np.square(R2TT / r2bt)
+        else:
 
-                # Check to see if threshold for the impulse response is meet
-                if R2T >= r2_thresh:
+            results = list(map(fit, k_channels, r2bt_channels))
 
-                  status = 1  # %Set status
-                  break
-
-                # Check to see if limit on the state space order has been reached
-                if ss == max_order:
-
-                  status = 2  # %Set status
-                  break
-
-                ss = ss + 1  # Increase state space order
+        pbar = ProgressBar(widgets=['Radiation damping state space realization for ' + self.name + ':', Percentage(), Bar()], maxval=max(len(channels), 1)).start()
+        count = 0
+        for (i, j), (ac, bc, cc, dc, k_ss_est, status, R2T, ss) in zip(channels, results):
 
-              self.rd.ss.A[i, j, 0:ac.shape[0], 0:ac.shape[0]] = ac
-              self.rd.ss.B[i, j, 0:bc.shape[0], 0] = bc[:, 0]
-              self.rd.ss.C[i, j, 0, 0:cc.shape[1]] = cc[0, :]
-              self.rd.ss.D[i, j] = dc
-              self.rd.ss.irk_bss[i, j, :] = k_ss_est
-              self.rd.ss.rad_conv[i, j] = status
-              self.rd.ss.r2t[i, j] = R2T
-              self.rd.ss.it[i, j] = ss
+            self.rd.ss.A[i, j, 0:ac.shape[0], 0:ac.shape[0]] = ac
+            self.rd.ss.B[i, j, 0:bc.shape[0], 0] = bc[:, 0]
+            self.rd.ss.C[i, j, 0, 0:cc.shape[1]] = cc[0, :]
+            self.rd.ss.D[i, j] = dc
+            self.rd.ss.irk_bss[i, j, :] = k_ss_est
+            self.rd.ss.rad_conv[i, j] = status
+            self.rd.ss.r2t[i, j] = R2T
+            self.rd.ss.it[i, j] = ss
 
             count += 1
             pbar.update(count)
@@ -549,11 +504,11 @@ class HydrodynamicData(object):
             self.scale = scale
 
         if self.scale is True and self.scaled is False:
-          print '\tScaling hydro coefficients for body ' + self.name + ' by rho, g, and w...'
+          print('\tScaling hydro coefficients for body ' + self.name + ' by rho, g, and w...')
           try:
               self.k *= self.rho * self.g
           except:
-              print '\t\tSpring stiffness not scaled'
+              print('\t\tSpring stiffness not scaled')
 
           self.am.all *= self.rho
           self.am.inf *= self.rho
@@ -575,18 +530,18 @@ class HydrodynamicData(object):
               self.ex.fk.im *= self.rho * self.g
 
 
-          for j in xrange(self.rd.all.shape[2]):
+          for j in range(self.rd.all.shape[2]):
 
             self.rd.all[:, :, j] = self.rd.all[:, :, j] * self.rho * self.w[j]
 
           self.scaled = True
 
         elif self.scale is False and self.scaled is True:
-          print '\tUn-scaling hydro coefficients for body ' + self.name + ' by rho, g, and w...'
+          print('\tUn-scaling hydro coefficients for body ' + self.name + ' by rho, g, and w...')
           try:
               self.k /= (self.rho * self.g)
           except:
-              print '\t\tSpring stiffness not un-scaled'
+              print('\t\tSpring stiffness not un-scaled')
           self.am.all /= self.rho
           self.am.inf /= self.rho
           if hasattr(self.am,'zero') is True:
@@ -606,45 +561,413 @@ class HydrodynamicData(object):
               self.ex.fk.re /= (self.rho * self.g)
               self.ex.fk.im /= (self.rho * self.g)
 
-          for j in xrange(self.rd.all.shape[2]):
+          for j in range(self.rd.all.shape[2]):
 
             self.rd.all[:, :, j] = self.rd.all[:, :, j] / (self.rho * self.w[j])
 
           self.scaled = False
 
 
-def _interpolate_for_irf(w_orig, w_interp, mat_in):
+def calc_irf_radiation_batch(bodies, t_end=100., n_t=1001, n_w=1001, w_min=None, w_max=None, method='trapz'):
+  '''Function to calculate the wave radiation IRF for a list of
+  HydrodynamicData bodies in a single calculation.
+
+  The bodies must share the same BEM frequencies and scaling, as is the case
+  for the bodies of one simulation. The cos(w*t) and sin(w*t) basis tables
+  are built once and the contraction runs over the radiation damping
+  coefficients of all bodies concatenated along the first axis, so the fixed
+  setup cost is paid once and the single large BLAS call replaces one
+  smaller call per body.
+
+  Args:
+      bodies : list of HydrodynamicData
+          The bodies to calculate the radiation IRF for
+      t_end : float
+          Calculation range for the IRF. The IRF is calculated from 0 to
+          t_end.
+      n_t : int
+          Number of timesteps in the IRF
+      n_w : int
+          Number of frequecy steps to use in the IRF calculation
+      w_min : float, optional
+          Minimum frequency to use in IRF calculation. If no vlaue is
+          given, this defaults to the minimum frequency from the BEM
+          simulations
+      w_max : float, optional
+          Maximum frequency to use in IRF calculation. If no vlaue is
+          given, this defaults to the maximum frequency from the BEM
+          simulations
+      method : {'trapz', 'fft'}, optional
+          IRF evaluation method. The default 'trapz' integrates on the
+          t_end/n_t time grid. 'fft' evaluates the integrals as discrete
+          cosine and sine transforms, which is much faster for large grids,
+          but requires w_min = 0 and fixes the timesteps to
+          t_k = k*pi/w_max, ignoring t_end and n_t
+
+  Returns:
+      No variables are directily returned by this function. The rd.irf
+      variables described in HydrodynamicData.calc_irf_radiation are
+      calculated for each body.
+
+  Examples:
+      Once a list of HydrodynamicData objects is created (e.g. the values of
+      the `body` dictionary of a bemio data reader), the radiation IRF of
+      all bodies can be calculated together:
+
+      >>> calc_irf_radiation_batch(list(wamit_data.body.values()))
   '''
-  Interpolate matrices for the IRF calculations
+  first = bodies[0]
+
+  for body in bodies[1:]:
+
+    if not np.allclose(body.w, first.w) or body.scaled != first.scaled:
+
+      raise ValueError('All bodies must have the same BEM frequencies and scaling to be batched')
+
+  if w_min is None:
+      w_min = first.w.min()
+  if w_max is None:
+      w_max = first.w.max()
+
+  irf_t = np.linspace(0, t_end, n_t)
+  irf_w = np.linspace(w_min, w_max, n_w)
+
+  # The radiation damping coefficients read from the BEM output are
+  # typically strided views into a larger array; normalize to contiguous
+  # memory before the frequency sweep. The interpolated coefficients and
+  # basis tables are held in single precision and only the final IRF is
+  # stored in double precision
+  rd_interp = np.concatenate(
+      [_interpolate_for_irf(body.w, irf_w,
+                            np.ascontiguousarray(body.rd.all)).astype(np.float32)
+       for body in bodies], axis=0)
+
+  if method == 'trapz':
+
+    dw = _trapezoid_weights(irf_w)
+
+    # Calculate the IRF by contracting the interpolated radiation damping
+    # coefficients against precomputed sin(w*t) and cos(w*t) bases with the
+    # integration weights folded in. This is equivalent to evaluating
+    # trapz(2/pi*rd*sin(w*t), w) and trapz(2/pi*rd*cos(w*t), w) for every
+    # (i, j, t) combination
+    wt = np.outer(irf_w, irf_t)
+    sin_wt = (2. / np.pi * np.sin(wt) * dw[:, None]).astype(np.float32)
+    cos_wt = (2. / np.pi * np.cos(wt) * dw[:, None]).astype(np.float32)
+
+    # Different IRF calculation methods are needed for dimensional and
+    # nondimensional hydro coefficients
+    if first.scaled is False:
+
+      cos_wt *= irf_w[:, None]
+
+    elif first.scaled is True:
+
+      sin_wt /= irf_w[:, None]
+
+    # K and L contract the same coefficients, so stack the two bases along
+    # the time axis and split the result of a single contraction
+    basis = np.concatenate([cos_wt, sin_wt], axis=1)
+    irf_kl = np.tensordot(rd_interp, basis, axes=([2], [0]))
+
+    irf_k = irf_kl[:, :, 0:irf_t.size]
+    irf_l = irf_kl[:, :, irf_t.size:]
+
+  elif method == 'fft':
+
+    # On the uniform frequency grid the K and L integrals are type 1
+    # discrete cosine and sine transforms, which the FFT evaluates in
+    # O(n_w log n_w) per channel instead of an O(n_w*n_t) contraction.
+    # The transforms pin the timesteps to t_k = k*pi/w_max, so t_end and
+    # n_t are ignored and the frequency grid must start at w = 0
+    if not np.isclose(irf_w[0], 0.0):
+
+      raise ValueError("method='fft' requires w_min = 0")
+
+    irf_t = np.arange(irf_w.size) * (np.pi / irf_w[-1])
+
+    # Fold the dimensional/nondimensional frequency factors into the
+    # transformed coefficients. The sine transform only sees the interior
+    # frequencies, where w > 0
+    if first.scaled is False:
+
+      f_cos = rd_interp * irf_w.astype(np.float32)
+      f_sin_int = rd_interp[:, :, 1:-1]
+
+    elif first.scaled is True:
+
+      f_cos = rd_interp
+      f_sin_int = rd_interp[:, :, 1:-1] / irf_w[1:-1].astype(np.float32)
+
+    else:
+
+      f_cos = rd_interp
+      f_sin_int = rd_interp[:, :, 1:-1]
+
+    # trapz(f*cos(w*t_k), w) == dw/2 * dct(f, type=1) on the uniform grid,
+    # and similarly for sin with the zero endpoint terms dropped
+    scale = (irf_w[1] - irf_w[0]) / np.pi
+    irf_k = scale * dct(f_cos, type=1, axis=-1)
+    irf_l = np.zeros(irf_k.shape, dtype=irf_k.dtype)
+    irf_l[:, :, 1:-1] = scale * dst(f_sin_int, type=1, axis=-1)
+
+  else:
+
+    raise ValueError('method must be trapz or fft')
+
+  row = 0
+  for body in bodies:
+
+    n_rows = body.rd.all.shape[0]
+    body.rd.irf.t = irf_t
+    body.rd.irf.w = irf_w
+    body.rd.irf.K = irf_k[row:row + n_rows].astype(np.float64)
+    body.rd.irf.L = irf_l[row:row + n_rows].astype(np.float64)
+    row += n_rows
+
+
+_interp_matrix_cache = {}
+
+
+def _build_linear_interp_matrix(w_src, w_dst):
+  '''
+  Internal function to build the sparse matrix p_mat implementing linear
+  interpolation from the increasing grid w_src to the grid w_dst, such that
+  p_mat.dot(y) == np.interp(w_dst, w_src, y). The matrix depends only on the
+  two grids, which are shared across coefficient quantities and across
+  repeated calc_irf_* calls, so it is cached keyed on the grid contents.
+  '''
+  key = (w_src.tobytes(), w_dst.tobytes())
+
+  if key not in _interp_matrix_cache:
+
+    ind = np.searchsorted(w_src, w_dst, side='right') - 1
+    ind = np.clip(ind, 0, w_src.size - 2)
+    alpha = (w_dst - w_src[ind]) / (w_src[ind + 1] - w_src[ind])
+
+    # Clamp to the endpoint values outside the source grid, matching
+    # np.interp, rather than extrapolating
+    alpha = np.clip(alpha, 0., 1.)
+
+    rows = np.repeat(np.arange(w_dst.size), 2)
+    cols = np.column_stack([ind, ind + 1]).ravel()
+    vals = np.column_stack([1. - alpha, alpha]).ravel()
+
+    _interp_matrix_cache[key] = csr_matrix(
+        (vals, (rows, cols)), shape=(w_dst.size, w_src.size))
+
+  return _interp_matrix_cache[key]
+
+
+def _trapezoid_weights(w):
+  '''
+  Internal function to calculate trapezoid rule integration weights for the
+  grid w, such that np.dot(y, _trapezoid_weights(w)) == np.trapz(y=y, x=w)
   '''
-  mat_interp = np.zeros([mat_in.shape[0], mat_in.shape[1], w_interp.size])
+  dw = np.empty_like(w)
+  dw[0] = (w[1] - w[0]) / 2.
+  dw[-1] = (w[-1] - w[-2]) / 2.
+  dw[1:-1] = (w[2:] - w[:-2]) / 2.
 
-  flip = False
+  return dw
 
+
+def _hankel_svd(y, k):
+  '''
+  Internal function to compute the k largest singular values and vectors of
+  the square Hankel matrix hankel(y) without forming the matrix. A Hankel
+  matrix-vector product is a convolution with the reversed vector, so the
+  operator is applied through scipy.signal.fftconvolve in O(n log n) time
+  and O(n) memory, and the truncated decomposition is computed with
+  scipy.sparse.linalg.svds.
+
+  Parameters:
+    y : np.array
+        First column of the Hankel matrix; the elements below the
+        anti-diagonal are zero, as produced by scipy.linalg.hankel(y)
+    k : int
+        Number of singular values and vectors to compute
+
+  Returns:
+    (u, svh, v) : tuple
+        Singular vectors and values ordered by decreasing singular value,
+        oriented as returned by np.linalg.svd
+  '''
+  n = y.size
+  c = np.concatenate([y, np.zeros(n - 1)])
+
+  def matvec(x):
+    # svds passes x as either a vector or an [n, 1] column
+    return fftconvolve(c, np.ravel(x)[::-1])[n - 1:2 * n - 1]
+
+  # hankel(y) is symmetric, so the adjoint product is the same convolution.
+  # A fixed starting vector keeps the iteration deterministic, so repeated
+  # runs on the same data produce identical singular vectors
+  h_op = LinearOperator((n, n), matvec=matvec, rmatvec=matvec, dtype=y.dtype)
+  u, svh, v = svds(h_op, k=k, v0=np.full(n, 1. / np.sqrt(n)))
+
+  # svds returns the singular values in ascending order
+  return u[:, ::-1], svh[::-1], v[::-1, :]
+
+
+_worker_thread_limits = None
+
+
+def _limit_blas_threads():
+  '''
+  Internal process pool initializer that limits each worker to a single BLAS
+  thread so that a pool of workers does not oversubscribe the machine.
+  threadpoolctl adjusts the already-loaded BLAS at runtime, which the thread
+  count environment variables cannot do for workers forked from a parent
+  that has imported numpy. The returned limits object is kept alive for the
+  lifetime of the worker
+  '''
+  global _worker_thread_limits
+  _worker_thread_limits = threadpool_limits(limits=1)
+
+
+def _fit_ss_channel(K_ij, r2bt, dt, max_order, r2_thresh):
+  '''
+  Internal function to fit a state space realization to the radiation IRF of
+  a single (i, j) channel. Each channel is fit independently, so this
+  function can be evaluated in parallel across channels.
+
+  Parameters:
+    K_ij : np.array
+        Radiation IRF of the channel, shape = [n_t]
+    r2bt : float
+        2 norm of the IRF about its mean, used to calculate the R^2 value
+    dt : float
+        IRF timestep
+    max_order : int
+        Maximum order of the state space realization fit
+    r2_thresh : float
+        The R^2 threshold used for the fit
+
+  Returns:
+    (ac, bc, cc, dc, k_ss_est, status, R2T, ss) : tuple
+        Continuous time state space matrices, the IRF estimated from the
+        state space approximation, the convergence status, the R^2 value of
+        the fit, and the realization order
+  '''
+  num_freq = K_ij.size
+  k_ss_est = np.zeros(num_freq)
+  y = dt * K_ij
+
+  # Perform Hankel Singular Value Decomposition. Only the max_order largest
+  # singular values can enter the fit, so the truncated decomposition is
+  # used rather than a full SVD of the dense matrix. The decomposition does
+  # not depend on the state space order, so it is computed once and
+  # re-sliced as the order search below raises ss
+  u, svh, v = _hankel_svd(y[1::], max_order)
+
+  ss = 2  # Initial state space order
+
+  while True:
+
+    u1 = u[0:num_freq - 2, 0:ss]
+    v1 = v.T[0:num_freq - 2, 0:ss]
+    u2 = u[1:num_freq - 1, 0:ss]
+    sqs = np.sqrt(svh[0:ss].reshape(ss, 1))
+    invss = 1 / sqs
+    ubar = np.dot(u1.T, u2)
+
+    a = ubar * np.dot(invss, sqs.T)
+    b = v1[0, :].reshape(ss, 1) * sqs
+    c = u1[0, :].reshape(1, ss) * sqs.T
+    d = y[0]
+
+    CoeA = dt / 2
+    CoeB = 1
+    CoeC = -CoeA
+    CoeD = 1
+
+    eye_ss = np.eye(ss)
+
+    # (T/2*I + T/2*A)^{-1}         = 2/T(I + A)^{-1}
+    # One solve against the stacked [I, b] right hand side factors the
+    # matrix once and yields both the explicit inverse and its product
+    # with b, avoiding a separate np.linalg.inv plus np.dot
+    sol = np.linalg.solve(CoeA * eye_ss - CoeC * a, np.hstack([eye_ss, b]))
+    iidd = sol[:, 0:ss]
+    iidd_b = sol[:, ss:]
+
+    # (A-I)2/T(I + A)^{-1}         = 2/T(A-I)(I + A)^{-1}
+    ac = np.dot(CoeB * a - CoeD * eye_ss, iidd)
+    # (T/2+T/2)*2/T(I + A)^{-1}B   = 2(I + A)^{-1}B
+    bc = (CoeA * CoeB - CoeC * CoeD) * iidd_b
+    # C * 2/T(I + A)^{-1}          = 2/T(I + A)^{-1}
+    cc = np.dot(c, iidd)
+    # D - T/2C (2/T(I + A)^{-1})B  = D - C(I + A)^{-1})B
+    dc = d + CoeC * np.dot(cc, b)
+
+    # Calculate impulse response function from state space approximation.
+    # expm(ac*dt*jj) is the jj-th power of expm(ac*dt), so evaluate the
+    # matrix exponential once and propagate cc*expm(ac*dt)^jj by repeated
+    # multiplication instead of calling expm at every timestep
+    M = expm(ac * dt)
+    cE = cc.copy()
+    for jj in range(num_freq):
+
+      k_ss_est[jj] = np.dot(cE, bc)[0, 0]
+      cE = np.dot(cE, M)
+
+    # Calculate 2 norm of the difference between know and estimated
+    # values impulse response function
+    R2TT = np.linalg.norm(K_ij - k_ss_est)
+    # Calculate the R2 value for impulse response function
+    R2T = 1 - np.square(R2TT / r2bt)
+
+    # Check to see if threshold for the impulse response is meet
+    if R2T >= r2_thresh:
+
+      status = 1  # %Set status
+      break
+
+    # Check to see if limit on the state space order has been reached
+    if ss == max_order:
+
+      status = 2  # %Set status
+      break
+
+    ss = ss + 1  # Increase state space order
+
+  return ac, bc, cc, dc, k_ss_est, status, R2T, ss
+
+
+def _interpolate_for_irf(w_orig, w_interp, mat_in):
+  '''
+  Interpolate matrices for the IRF calculations
+  '''
+  # The interpolation requires an increasing frequency grid, so flip the
+  # data once here on the full array
   if w_orig[0] > w_orig[1]:
 
-    w_tmp = np.flipud(w_orig)
-    flip = True
+    w_tmp = w_orig[::-1]
+    mat_tmp = mat_in[..., ::-1]
 
   else:
 
     w_tmp = w_orig
+    mat_tmp = mat_in
 
-  for i in xrange(mat_in.shape[0]):
-
-    for j in xrange(mat_in.shape[1]):
-
-      if flip is True:
+  # When the destination grid matches the source grid the interpolation is
+  # the identity, so return the data as is. This is the common case when
+  # the IRF is calculated with n_w equal to the number of BEM frequencies
+  # over the full frequency range
+  if w_tmp.size == w_interp.size and np.allclose(w_tmp, w_interp):
 
-        rdTmp = np.flipud(mat_in[i, j, :])
+    return mat_tmp
 
-      else:
-        rdTmp = mat_in[i, j, :]
+  # Linear interpolation from one fixed grid to another is a sparse matrix
+  # product. The matrix is cached across calls, so repeated IRF
+  # calculations on the same grids (e.g. per body, or excitation followed
+  # by radiation) only pay for the matrix product
+  p_mat = _build_linear_interp_matrix(w_tmp, w_interp)
 
-      f = interpolate.interp1d(x=w_tmp, y=rdTmp)
-      mat_interp[i, j, :] = f(w_interp)
+  shape_out = mat_tmp.shape[:-1] + (w_interp.size,)
 
-  return mat_interp
+  return p_mat.dot(mat_tmp.reshape(-1, w_tmp.size).T).T.reshape(shape_out)
 
 
 def generate_file_names(out_file):
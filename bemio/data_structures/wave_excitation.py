@@ -13,7 +13,6 @@
 # limitations under the License.
 import numpy as np
 from scipy import interpolate
-from progressbar import ProgressBar, Bar, Percentage
 
 class ImpulseResponseFunction(object):
     '''Internal bemio object to contain impulse response function (IRF) data
@@ -79,17 +78,6 @@ class WaveExcitationConvolution(object):
         # Assume that the IRF dt is used unless specified by the user
         # if self.excitation_force.dt is None:
         #     self.excitation_force.dt = self.irf.t[1] - self.irf.t[0]
-        # This code caluclates the wave excitation force manually - the below method that uses the convolve function is much more efficient
-        # self.excitation_force.t = np.linspace(self.wave_elevation.t.min(), self.wave_elevation.t.max(), (self.wave_elevation.t.max()-self.wave_elevation.t.min())/self.excitation_force.dt+1)
-        # pbar_max_val = self.excitation_force.t.max()
-        # pbar = ProgressBar(widgets=['Calculating the excitation force time history:', Percentage(), Bar()], maxval=pbar_max_val).start()
-        # f_ex = []
-        # for t in self.excitation_force.t:
-        #     f_ex.append(np.trapz(y=irf_interp(self.irf.t)*eta_interp(t-self.irf.t),x=self.irf.t))
-        #
-        #     pbar.update(t)
-        # pbar.finish()
-
         f_ex_conv = np.convolve(self.wave_elevation.eta, irf, mode='same')*self.wave_elevation.dt
 
         self.excitation_force.f = np.array(f_ex_conv)
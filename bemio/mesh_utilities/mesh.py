@@ -46,7 +46,7 @@ try:
 
 except:
 
-    print 'The VTK Python module is required for a significant amnount of functionality in this module. Many functions will not be available for use.'
+    print('The VTK Python module is required for a significant amnount of functionality in this module. Many functions will not be available for use.')
 
 
 
@@ -198,7 +198,7 @@ class PanelMesh(object):
             self._hydrostatic_stiffness[4,4] += self.volume_x * self.center_of_buoyancy[2] - self.volume_x * self.center_of_gravity[2]
             self._hydrostatic_stiffness[4,5] += -self.volume_x * self.center_of_buoyancy[1] + self.volume_x * self.center_of_gravity[1]
 
-            print 'Calculated hydorstatic stiffness'
+            print('Calculated hydorstatic stiffness')
 
         return self._hydrostatic_stiffness
 
@@ -224,7 +224,7 @@ class PanelMesh(object):
                     z_b += self.normals[face_n][2]*self.centroid[face_n][2]**2*self.cell_surface_area[face_n]
             self._center_of_buoyancy = 1./(2.*self.volume_x )*np.array([x_b, y_b, z_b])
 
-            print 'Calculated the center of buoyancy'
+            print('Calculated the center of buoyancy')
 
         return self._center_of_buoyancy
 
@@ -232,7 +232,7 @@ class PanelMesh(object):
     def normals(self, ):
         if self._normals is None:
             self._normals = {}
-            for face_n in xrange(self.faces.shape[0]):
+            for face_n in range(self.faces.shape[0]):
                 a = self.points[self.faces[face_n][1]] - self.points[self.faces[face_n][0]]
                 b = self.points[self.faces[face_n][2]] - self.points[self.faces[face_n][1]]
                 self._normals[face_n] = np.cross(a,b)
@@ -249,7 +249,7 @@ class PanelMesh(object):
 
                 self._normals[face_n] /= np.linalg.norm(self._normals[face_n])
 
-            print 'Calculated mesh cell normals'
+            print('Calculated mesh cell normals')
 
         return self._normals
 
@@ -261,14 +261,14 @@ class PanelMesh(object):
         '''
         if self._cell_surface_area is None:
             self._cell_surface_area = {}
-            for face_n in xrange(self.faces.shape[0]):
+            for face_n in range(self.faces.shape[0]):
                 a = self.points[self.faces[face_n][1]] - self.points[self.faces[face_n][0]]
                 b = self.points[self.faces[face_n][2]] - self.points[self.faces[face_n][1]]
                 c = self.points[self.faces[face_n][3]] - self.points[self.faces[face_n][2]]
                 d = self.points[self.faces[face_n][0]] - self.points[self.faces[face_n][3]]
                 self._cell_surface_area[face_n] = 1./2. * ( np.linalg.norm(np.cross(a,b)) + np.linalg.norm(np.cross(c,d)) )
 
-            print 'Calculated surface cell area'
+            print('Calculated surface cell area')
 
         return self._cell_surface_area
 
@@ -278,7 +278,7 @@ class PanelMesh(object):
 
             self._surface_area = sum(self.cell_surface_area.values())
 
-            print 'Calculated surface area'
+            print('Calculated surface area')
 
         return self._surface_area
 
@@ -296,7 +296,7 @@ class PanelMesh(object):
             mass_props.SetInputDataObject(tri_mesh)
             self._volume_vtk = mass_props.GetVolume()
 
-            print 'Calculated mesh volume using VTK library'
+            print('Calculated mesh volume using VTK library')
 
         return self._volume_vtk
 
@@ -348,7 +348,7 @@ class PanelMesh(object):
             mass_props.SetInputDataObject(tri_mesh)
             self._surface_area_vtk = mass_props.GetSurfaceArea()
 
-            print 'Calculated mesh surface area using VTK Python bindings'
+            print('Calculated mesh surface area using VTK Python bindings')
 
         return self._surface_area_vtk
 
@@ -423,7 +423,7 @@ class PanelMesh(object):
         com.Update()
         self.center_of_gravity = com.GetCenter()
 
-        print 'Calculated center of gravity assuming uniform material density'
+        print('Calculated center of gravity assuming uniform material density')
 
     def view(self, color=[0.5,1,0.5], opacity=1.0, save_png=False, camera_pos=[50,50,50], interact=True):
         '''Function to view the mesh using the VTK library
@@ -505,7 +505,7 @@ class PanelMesh(object):
             writer.SetInputDataObject(w2if.GetOutput())
             writer.Write()
 
-            print 'Wrote mesh image to: ' + self.files['png']
+            print('Wrote mesh image to: ' + self.files['png'])
 
         if interact is True:
             iren.Start()
@@ -597,7 +597,7 @@ class PanelMesh(object):
         centroid = vtk.vtkPolyData()
         centroid.SetPoints(centroid_points)
         centroid.SetVerts(vertices)
-        n=np.array(self.normals.values())
+        n=np.array(list(self.normals.values()))
         nv = vtk.util.numpy_support.numpy_to_vtk(n)
         pv =centroid.GetPointData()
         _ = pv.SetNormals(nv)
@@ -779,7 +779,7 @@ class PanelMesh(object):
             writer.SetFileName(self.files['png'])
             writer.SetInputDataObject(w2if.GetOutput())
             writer.Write()
-            print 'Wrote mesh image to: ' + self.files['png']
+            print('Wrote mesh image to: ' + self.files['png'])
         # Set interaction mode
         if interact is True:
             iren.Start()
@@ -835,7 +835,7 @@ class PanelMesh(object):
         self.points = self.points*scale_vect
         self.scale_vect = scale_vect
         self._create_vtp_mesh()
-        print 'Scaled mesh by: ' + str(scale_vect)
+        print('Scaled mesh by: ' + str(scale_vect))
 
     def translate(self,translation_vect,translate_cog=True):
         '''Function used to translate mesh obvjects in the x, y, and z directions.
@@ -863,7 +863,7 @@ class PanelMesh(object):
         if translate_cog is True:
             self.center_of_gravity += translation_vect
 
-        print 'Translated mesh by: ' + str(translation_vect) + '\nCenter of gravity is: ' + str(self.center_of_gravity)
+        print('Translated mesh by: ' + str(translation_vect) + '\nCenter of gravity is: ' + str(self.center_of_gravity))
 
     def xzmirror(self,):
         '''Function used to mirror the mesh object about the xz plane.
@@ -914,7 +914,7 @@ class PanelMesh(object):
             return unique_a,inverse_a
         unique_points,inverse_points = unique_rows(self.points)
         map = np.zeros([len(inverse_points),2])
-        map[:,0] = np.array(range(len(self.points)))
+        map[:,0] = np.array(list(range(len(self.points))))
         map[:,1] = inverse_points
         faces_org = self.faces.flatten()
         faces_new = np.zeros(np.shape(faces_org))
@@ -978,7 +978,7 @@ class PanelMesh(object):
         writer.SetDataModeToAscii()
         writer.Write()
 
-        print 'Wrote VTK PolyData mesh to: ' + str(self.files['vtp'])
+        print('Wrote VTK PolyData mesh to: ' + str(self.files['vtp']))
 
     def _write_nemoh(self):
         '''Internal function to write NEMOH mesh files
@@ -986,17 +986,17 @@ class PanelMesh(object):
         with open(self.files['nemoh'],'w') as fid:
             fid.write('2 0') # This should not be hard coded
             fid.write('\n')
-            for i in xrange(self.points.shape[0]):
+            for i in range(self.points.shape[0]):
                 fid.write(str(i+1) + ' ' +str(self.points[i]).replace('[','').replace(']',''))
                 fid.write('\n')
             fid.write('0 0 0 0')
             fid.write('\n')
-            for i in xrange(self.faces.shape[0]):
+            for i in range(self.faces.shape[0]):
                 fid.write(str(self.faces[i]+1).replace('[','').replace(']','').replace('.',''))
                 fid.write('\n')
             fid.write('0 0 0 0')
 
-        print 'Wrote NEMOH mesh to: ' + str(self.files['nemoh'])
+        print('Wrote NEMOH mesh to: ' + str(self.files['nemoh']))
 
     def _write_gdf(self):
         '''Internal function to write WAMIT mesh files
@@ -1019,7 +1019,7 @@ class PanelMesh(object):
                     for j,pointKey in enumerate(faceMod):
                         fid.write(str(self.points[pointKey]).replace(',','').replace('[','').replace(']','') + '\n')
 
-        print 'Wrote WAMIT mesh to: ' + str(self.files['wamit'])
+        print('Wrote WAMIT mesh to: ' + str(self.files['wamit']))
 
     def _calc_component_vol(self, ):
         '''Internal function to calculate mesh volume using the methods
@@ -1030,14 +1030,14 @@ class PanelMesh(object):
         self._volume_z = 0.
         volume = 0.
 
-        for face_n in xrange(self.faces.shape[0]):
+        for face_n in range(self.faces.shape[0]):
             volume += self.normals[face_n]*self.centroid[face_n]*self.cell_surface_area[face_n]
 
         self._volume_x = volume[0]
         self._volume_y = volume[1]
         self._volume_z = volume[2]
 
-        print 'Calculated x y and z mesh volumes'
+        print('Calculated x y and z mesh volumes')
 
 def _read_gdf(file_name):
     '''Internal function to read gdf wamit meshes
@@ -1057,7 +1057,7 @@ def _read_gdf(file_name):
     mesh_data.isy = float(lines[2].split()[1])
     mesh_data.num_faces = int(lines[3].split()[0])
     mesh_data.num_points = mesh_data.num_faces * 4
-    mesh_data.points = np.array([temp.split() for temp in lines[4:]]).astype(np.float)
+    mesh_data.points = np.array([temp.split() for temp in lines[4:]]).astype(float)
 
     mesh_data.pointsString = [str(temp).replace(","      ,'').replace('\r','') for temp in lines[4:]] # Output string for Nemoh mesh fil
 
@@ -1103,15 +1103,15 @@ def _read_vtp(file_name):
     mesh_data.num_faces =    int(readerOut.GetNumberOfCells())
     mesh_data.num_points =   int(readerOut.GetNumberOfPoints())
 
-    for i in xrange(mesh_data.num_points):
+    for i in range(mesh_data.num_points):
         mesh_data.points.append(readerOut.GetPoint(i))
     mesh_data.points = np.array(mesh_data.points)
 
-    for i in xrange(mesh_data.num_faces):
+    for i in range(mesh_data.num_faces):
         c = readerOut.GetCell(i)
         numCellPoints = int(c.GetNumberOfPoints())
         idsTemp = []
-        for i in xrange(numCellPoints):
+        for i in range(numCellPoints):
             idsTemp.append(int(c.GetPointId(i)))
         mesh_data.faces.append(np.array(idsTemp))
     mesh_data.faces = np.array(mesh_data.faces)
@@ -1184,7 +1184,7 @@ def read(file_name):
 
         >>> mesh.open()
     '''
-    print 'Reading mesh file: ' + str(file_name)
+    print('Reading mesh file: ' + str(file_name))
 
     file_name = os.path.abspath(file_name)
     (f_name,f_ext) = os.path.splitext(file_name)
@@ -1215,7 +1215,7 @@ def read(file_name):
 
         mesh_data._create_vtp_mesh()
 
-    print 'Successfully read mesh file: ' + str(file_name)
+    print('Successfully read mesh file: ' + str(file_name))
 
     return mesh_data
 
@@ -1295,6 +1295,6 @@ def cut_mesh(mesh_obj, plane_ind=2, plane_loc=-1e-5, cut_dir=1.):
 
     cut_mesh.files_base = os.path.splitext(cut_mesh.file_name)[0] + '_cut_mesh_bemio_output'
 
-    print 'Cut mesh in direction [' + str(plane_ind) + '] in direction [' + str(cut_dir) + '] at the location [' + str(plane_loc) + ']'
+    print('Cut mesh in direction [' + str(plane_ind) + '] in direction [' + str(cut_dir) + '] at the location [' + str(plane_loc) + ']')
 
     return cut_mesh
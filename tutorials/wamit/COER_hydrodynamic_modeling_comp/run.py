@@ -6,8 +6,8 @@ from bemio.io.output import write_hdf5
 wamit_data_f = read(out_file='wamit_data/coer_comp_f.out')
 
 # Calculate IRF and SS coefficients
-for i in xrange(wamit_data_f.body[0].num_bodies):
- 	wamit_data_f.body[i].calc_irf_radiation(t_end=20.0, n_t=1001, n_w=501)
+for i in range(wamit_data_f.body[0].num_bodies):
+	wamit_data_f.body[i].calc_irf_radiation(t_end=20.0, n_t=1001, n_w=501)
 	wamit_data_f.body[i].calc_irf_excitation(t_end=20.0, n_t=1001, n_w=501)
 
 # Save the data in the hdf5 format.
@@ -19,8 +19,8 @@ write_hdf5(wamit_data_f,out_file='coer_comp_f.h5')
 wamit_data_f_scaled = read(out_file='wamit_data/coer_comp_f.out', scale=True)
 
 # Calculate IRF and plot using the wamit module
-for i in xrange(wamit_data_f_scaled.body[0].num_bodies):
- 	wamit_data_f_scaled.body[i].calc_irf_radiation(t_end=20.0, n_t=1001, n_w=1001)
+for i in range(wamit_data_f_scaled.body[0].num_bodies):
+	wamit_data_f_scaled.body[i].calc_irf_radiation(t_end=20.0, n_t=1001, n_w=1001)
 	wamit_data_f_scaled.body[i].calc_irf_excitation(t_end=20.0, n_t=1001, n_w=1001)
 
 # Save the data in the hdf5 format.
@@ -12,8 +12,8 @@ wamit_data = read(out_file='./ecm_ellipsoid.out')
 
 
 # Calculate IRF and plot using the wamit module
-for i in xrange(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
- 	wamit_data.body[i].calc_irf_radiation(t_end=100,n_t=201,n_w=201)
+for i in range(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
+	wamit_data.body[i].calc_irf_radiation(t_end=100,n_t=201,n_w=201)
 	#wamit_data.body[i].calc_ss_radiation(max_order=5, r2_thresh=0.90)
 	wamit_data.body[i].calc_irf_excitation(t_end=50,n_t=101,n_w=101)
 
@@ -8,8 +8,8 @@ wamit_data = read(out_file='wamit_data/oswec.out')
 
 
 # Calculate IRF and plot using the wamit module
-for i in xrange(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
- 	wamit_data.body[i].calc_irf_radiation(t_end=20, n_t=501, n_w=501, w_max=10.)
+for i in range(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
+	wamit_data.body[i].calc_irf_radiation(t_end=20, n_t=501, n_w=501, w_max=10.)
 	#wamit_data.body[i].calc_ss_radiation(max_order=5, r2_thresh=0.90)
 	wamit_data.body[i].calc_irf_excitation(t_end=30. , n_t=501, n_w=501)
 
@@ -12,8 +12,8 @@ wamit_data = read(out_file='./wec3.out')
 
 
 # Calculate IRF and plot using the wamit module
-for i in xrange(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
- 	wamit_data.body[i].calc_irf_radiation(t_end=100., n_t=1001, n_w=501)
+for i in range(wamit_data.body[0].num_bodies): #wamit_data.body[0].num_bodies
+	wamit_data.body[i].calc_irf_radiation(t_end=100., n_t=1001, n_w=501)
 	#wamit_data.body[i].calc_ss_radiation(max_order=5, r2_thresh=0.90)
 	wamit_data.body[i].calc_irf_excitation(t_end=100., n_t=1001, n_w=501)
 